@@ -1,6 +1,5 @@
 from bisect import bisect_left, bisect_right
 from difflib import SequenceMatcher
-from functools import partial
 from logging import getLogger
 from typing import Any, Callable, Iterable, Optional, Tuple
 
@@ -119,12 +118,8 @@ def annotate_citations(
             annotated_span = before + span_text + after
 
         # append each span
-        out.extend(
-            [
-                plain_text[last_end:start],
-                annotated_span,
-            ]
-        )
+        out.append(plain_text[last_end:start])
+        out.append(annotated_span)
         last_end = end
 
     # append text after final citation
@@ -151,27 +146,24 @@ class SpanUpdater:
     """
 
     def __init__(self, text_before, text_after, use_dmp=True):
-        """To set up, we need to populate self.offsets and self.updaters:
+        """To set up, we need to populate self.offsets, self.new_offsets and
+        self.shifts:
             >>> SpanUpdater(text_before, text_after).offsets
             [0, 4]
-            >>> SpanUpdater(text_before, text_after).updaters
-            [partial(shift_offset, delta=0), partial(shift_offset, delta=4)]
-        This indicates that offsets 0 to 4 need to be shifted by 0,
-        and offsets 4 and up need to be shifted by 4.
+            >>> SpanUpdater(text_before, text_after).new_offsets
+            [0, 8]
+            >>> SpanUpdater(text_before, text_after).shifts
+            [True, True]
+        This indicates that offsets 0 to 4 move to 0 and up, and offsets
+        4 and up move to 8 and up. Where a range was deleted, shifts is False
+        and every offset in the range moves to the same new offset.
         """
-
-        # helpers for the two kinds of updates we need to apply to offsets:
-        def shift_offset(offset, delta):
-            return offset + delta
-
-        def replace_offset(offset, new_offset):
-            return new_offset
-
-        # diff the two strings and set self.offsets and self.updaters:
+        # diff the two strings and set up the offset table:
         offset = 0
         delta = 0
         self.offsets = offsets = []
-        self.updaters = updaters = []
+        self.new_offsets = new_offsets = []
+        self.shifts = shifts = []
         get_diff_steps = (
             self.get_diff_steps if use_dmp else self.get_diff_steps_builtin
         )
@@ -180,7 +172,8 @@ class SpanUpdater:
                 # start a new range with a relative delta,
                 # and push the offset forward
                 offsets.append(offset)
-                updaters.append(partial(shift_offset, delta=delta))
+                new_offsets.append(offset + delta)
+                shifts.append(True)
                 offset += amount
             elif operation == "+":
                 # push the delta forward
@@ -189,9 +182,8 @@ class SpanUpdater:
                 # Start a new range with an absolute delta.
                 # Push the offset forward and delta backward.
                 offsets.append(offset)
-                updaters.append(
-                    partial(replace_offset, new_offset=offset + delta)
-                )
+                new_offsets.append(offset + delta)
+                shifts.append(False)
                 offset += amount
                 delta -= amount
 
@@ -234,5 +226,7 @@ class SpanUpdater:
     def update(self, offset, bisect):
         """Shift an offset left or right."""
         index = bisect(self.offsets, offset) - 1
-        updater = self.updaters[index]
-        return updater(offset)
+        new_offset = self.new_offsets[index]
+        if self.shifts[index]:
+            new_offset += offset - self.offsets[index]
+        return new_offset
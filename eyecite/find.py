@@ -133,7 +133,8 @@ def _extract_reference_citations(
     :param plain_text: the text
     :return: Pin cite reference citations
     """
-    if len(plain_text) <= citation.span()[-1]:
+    offset = citation.span()[-1]
+    if len(plain_text) <= offset:
         return []
     if not isinstance(citation, FullCaseCitation):
         return []
@@ -166,19 +167,17 @@ def _extract_reference_citations(
         rf"\b(?:{'|'.join(regexes)})\s+at\s+(?P<pin_cite>\d{{1,5}})\b"
     )
     reference_citations = []
-    remaining_text = plain_text[citation.span()[-1] :]
-    offset = citation.span()[-1]
-    for match in re.compile(pin_cite_re).finditer(remaining_text):
+    # scan from the end of the citation, rather than slicing off a copy of
+    # the rest of the text for every full citation
+    for match in re.compile(pin_cite_re).finditer(plain_text, offset):
         start, end = match.span()
         matched_text = match.group(0)
         reference = ReferenceCitation(
-            token=CaseReferenceToken(
-                data=matched_text, start=start + offset, end=end + offset
-            ),
-            span_start=start + offset,
-            span_end=end + offset,
-            full_span_start=start + offset,
-            full_span_end=end + offset,
+            token=CaseReferenceToken(data=matched_text, start=start, end=end),
+            span_start=start,
+            span_end=end,
+            full_span_start=start,
+            full_span_end=end,
             index=0,
             metadata=match.groupdict(),
         )
@@ -1,5 +1,5 @@
 from datetime import date
-from typing import List, Optional, Tuple, cast
+from typing import Dict, List, Optional, Tuple, cast
 
 import regex as re
 from courts_db import courts
@@ -43,25 +43,37 @@ def get_court_by_paren(paren_string: str) -> Optional[str]:
 
     # Remove whitespace and punctuation because citation strings sometimes lack
     # internal spaces, e.g. "Pa.Super." or "SC" (South Carolina)
-    court_str = re.sub(r"[^\w]", "", paren_string).lower()
+    court_str = _normalize_court_string(paren_string)
+    if not court_str:
+        return None
+
+    # Check for an exact match first
+    if court_str in _courts_by_string:
+        return str(_courts_by_string[court_str])
 
-    court_code = None
-    if court_str:
-        for court in courts:
-            s = re.sub(r"[^\w]", "", court["citation_string"]).lower()
+    # If no exact match, return the last startswith match, if any
+    for s, court_id in reversed(_court_strings):
+        if s.startswith(court_str):
+            return court_id
 
-            # Check for an exact match first
-            if s == court_str:
-                return str(court["id"])
+    return None
 
-            # If no exact match, try to record a startswith match for possible
-            # eventual return
-            if s.startswith(court_str):
-                court_code = court["id"]
 
-        return court_code
+def _normalize_court_string(court_string: str) -> str:
+    """Strip punctuation and whitespace from a court citation string, and
+    lowercase it."""
+    return str(re.sub(r"[^\w]", "", court_string)).lower()
 
-    return court_code
+
+# Normalized citation strings of all courts, in courts_db order, and a lookup
+# of each string to the first court that uses it.
+_court_strings: List[Tuple[str, str]] = [
+    (_normalize_court_string(court["citation_string"]), court["id"])
+    for court in courts
+]
+_courts_by_string: Dict[str, str] = {
+    s: court_id for s, court_id in reversed(_court_strings)
+}
 
 
 # Highest valid year is this year + 1 because courts in December sometimes
@@ -329,17 +341,17 @@ def filter_citations(citations: List[CitationBase]) -> List[CitationBase]:
     :return: Sorted and filtered citations
     """
     filtered_citations: List[CitationBase] = []
-    sorted_citations = sorted(citations, key=lambda citation: citation.span())
-    for citation in sorted_citations:
-        if filtered_citations:
-            last_citation = filtered_citations[-1]
-            last_span = last_citation.span()
-            current_span = citation.span()
-
-            if current_span[0] <= last_span[1]:
-                # Remove overlapping citations that can occur in edge cases
-                continue
-        filtered_citations.append(citation)
+    # compute each span once, then sort and sweep over the spans
+    spans = [citation.span() for citation in citations]
+    order = sorted(range(len(citations)), key=spans.__getitem__)
+    last_end = None
+    for i in order:
+        start, end = spans[i]
+        if last_end is not None and start <= last_end:
+            # Remove overlapping citations that can occur in edge cases
+            continue
+        filtered_citations.append(citations[i])
+        last_end = end
     return filtered_citations
 
 
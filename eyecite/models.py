@@ -192,13 +192,13 @@ class CitationBase:
 
         :returns: Tuple of start and end indicies
         """
-        start = self.full_span_start
-        if start is None:
-            start = self.span()[0]
-
-        end = self.full_span_end
-        if end is None:
-            end = self.span()[1]
+        start, end = self.full_span_start, self.full_span_end
+        if start is None or end is None:
+            span_start, span_end = self.span()
+            if start is None:
+                start = span_start
+            if end is None:
+                end = span_end
 
         return start, end
 
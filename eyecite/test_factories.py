@@ -54,10 +54,9 @@ def case_citation(
     **kwargs,
 ):
     """Convenience function for creating mock CaseCitation objects."""
-    metadata = kwargs.setdefault("metadata", {})
+    defaults = {"court": "scotus"} if reporter == "U.S." else {}
+    metadata = kwargs["metadata"] = {**defaults, **kwargs.get("metadata", {})}
     groups = kwargs.setdefault("groups", {})
-    if reporter == "U.S.":
-        metadata.setdefault("court", "scotus")
     if not source_text:
         source_text = f"{volume} {reporter} {page}"
     if short:
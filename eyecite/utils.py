@@ -4,6 +4,14 @@ import re
 
 from lxml import etree
 
+# A single HTML tag, such as "<i>" or "</a>"
+HTML_TAG_REGEX = re.compile(r"(<[^>]+>)")
+
+# Translation tables for the plain character deletions in strip_punct
+_DELETE_PUNCT = str.maketrans("", "", ",;:@#$%&")
+_DELETE_QUESTION_EXCLAMATION = str.maketrans("", "", "?!")
+_DELETE_BRACKETS = str.maketrans("", "", "[](){}<>")
+
 
 def strip_punct(text: str) -> str:
     """Strips punctuation from a given string
@@ -14,23 +22,23 @@ def strip_punct(text: str) -> str:
     """
     # starting quotes
     text = re.sub(r"^[\"\']", r"", text)
-    text = re.sub(r"(``)", r"", text)
+    text = text.replace("``", "")
     text = re.sub(r'([ (\[{<])"', r"", text)
 
     # punctuation
-    text = re.sub(r"\.\.\.", r"", text)
-    text = re.sub(r"[,;:@#$%&]", r"", text)
+    text = text.replace("...", "")
+    text = text.translate(_DELETE_PUNCT)
     text = re.sub(r'([^\.])(\.)([\]\)}>"\']*)\s*$', r"\1", text)
-    text = re.sub(r"[?!]", r"", text)
+    text = text.translate(_DELETE_QUESTION_EXCLAMATION)
 
     text = re.sub(r"([^'])' ", r"", text)
 
     # parens, brackets, etc.
-    text = re.sub(r"[\]\[\(\)\{\}\<\>]", r"", text)
-    text = re.sub(r"--", r"", text)
+    text = text.translate(_DELETE_BRACKETS)
+    text = text.replace("--", "")
 
     # ending quotes
-    text = re.sub(r'"', "", text)
+    text = text.replace('"', "")
     text = re.sub(r"(\S)(\'\'?)", r"\1", text)
 
     return text.strip()
@@ -52,7 +60,7 @@ def is_balanced_html(text: str) -> bool:
 
 def wrap_html_tags(text: str, before: str, after: str):
     """Wrap any html tags in text with before and after strings."""
-    return re.sub(r"(<[^>]+>)", rf"{before}\1{after}", text)
+    return HTML_TAG_REGEX.sub(rf"{before}\1{after}", text)
 
 
 def hyperscan_match(regexes, text):
@@ -163,24 +171,18 @@ def maybe_balance_style_tags(
         has_closing = closing_tag in span_text
         if has_opening and not has_closing:
             # look for closing tag after the end
-            extended_end = max(
-                end + len(closing_tag) + tolerance, len(plain_text)
-            )
-            if end_match := re.search(
-                rf"{span_text}\s*{closing_tag}",
-                plain_text[start:extended_end],
-                flags=re.MULTILINE,
-            ):
-                end = start + end_match.end()
+            window = plain_text[end : end + tolerance + len(closing_tag)]
+            stripped = window.lstrip()
+            if stripped.startswith(closing_tag):
+                end += len(window) - len(stripped) + len(closing_tag)
 
         if not has_opening and has_closing:
             # look for opening tag before the start
-            extended_start = min(start - len(opening_tag) - tolerance, 0)
-            if start_match := re.search(
-                rf"{opening_tag}\s*{span_text}",
-                plain_text[extended_start:end],
-                flags=re.MULTILINE,
-            ):
-                start = extended_start + start_match.start()
+            window = plain_text[
+                max(start - tolerance - len(opening_tag), 0) : start
+            ]
+            stripped = window.rstrip()
+            if stripped.endswith(opening_tag):
+                start -= len(window) - len(stripped) + len(opening_tag)
 
     return start, end, plain_text[start:end]
@@ -3,7 +3,7 @@ from unittest import TestCase
 from eyecite import get_citations
 
 
-class RegexesTest(TestCase):
+class CourtsTest(TestCase):
     def test_parenthetical_court_parser(self):
         """Check that citations return the appropriate court."""
         samples = {
@@ -33,6 +33,7 @@ class RegexesTest(TestCase):
             "State v. Michael J., 875 A.2d 510, 534-35 (Conn. 2005)": "conn",
             "Commonwealth v. Muniz, 164 A.3d 1189 (Pa. 2017)": "pa",
         }
-        for key in samples.keys():
-            eyecite_result = get_citations(key)
-            self.assertEqual(eyecite_result[0].metadata.court, samples[key])
+        for key, court in samples.items():
+            with self.subTest(key):
+                eyecite_result = get_citations(key)
+                self.assertEqual(eyecite_result[0].metadata.court, court)
@@ -16,14 +16,13 @@ class ModelsTest(TestCase):
         """Are two citation objects equal when their attributes are
         the same?"""
         for factory in [case_citation, journal_citation, law_citation]:
-            citations = [
-                factory(),
-                factory(),
-            ]
-            print(f"Testing {factory.__name__} comparison...", end=" ")
-            self.assertEqual(citations[0], citations[1])
-            self.assertEqual(hash(citations[0]), hash(citations[1]))
-            print("✓")
+            with self.subTest(factory.__name__):
+                citations = [
+                    factory(),
+                    factory(),
+                ]
+                self.assertEqual(citations[0], citations[1])
+                self.assertEqual(hash(citations[0]), hash(citations[1]))
 
     def test_resource_comparison(self):
         """Are two Resource objects equal when their citations' attributes are
@@ -32,10 +31,8 @@ class ModelsTest(TestCase):
             Resource(case_citation(2, volume="2", reporter="U.S.", page="2")),
             Resource(case_citation(2, volume="2", reporter="U.S.", page="2")),
         ]
-        print("Testing resource comparison...", end=" ")
         self.assertEqual(resources[0], resources[1])
         self.assertEqual(hash(resources[0]), hash(resources[1]))
-        print("✓")
 
     def test_resource_comparison_with_missing_page_cites(self):
         """Are two Resource objects different when their citations are missing
@@ -44,10 +41,8 @@ class ModelsTest(TestCase):
             Resource(case_citation(2, volume="2", reporter="U.S.", page="__")),
             Resource(case_citation(2, volume="2", reporter="U.S.", page="__")),
         ]
-        print("Testing resource comparison with missing pages...", end=" ")
         self.assertNotEqual(citations[0], citations[1])
         self.assertNotEqual(hash(citations[0]), hash(citations[1]))
-        print("✓")
 
     def test_citation_comparison_with_missing_page_cites(self):
         """Are two citation objects different when one of them is missing
@@ -56,10 +51,8 @@ class ModelsTest(TestCase):
             case_citation(2, volume="2", reporter="U.S.", page="__"),
             case_citation(2, volume="2", reporter="U.S.", page="__"),
         ]
-        print("Testing citation comparison with missing pages...", end=" ")
         self.assertNotEqual(citations[0], citations[1])
         self.assertNotEqual(hash(citations[0]), hash(citations[1]))
-        print("✓")
 
     def test_citation_comparison_with_corrected_reporter(self):
         """Are two citation objects equal when their attributes are
@@ -68,12 +61,8 @@ class ModelsTest(TestCase):
             case_citation(2, volume="2", reporter="U.S.", page="4"),
             case_citation(2, volume="2", reporter="U. S.", page="4"),
         ]
-        print(
-            "Testing citation comparison with corrected reporter...", end=" "
-        )
         self.assertEqual(citations[0], citations[1])
         self.assertEqual(hash(citations[0]), hash(citations[1]))
-        print("✓")
 
     def test_citation_comparison_with_different_source_text(self):
         """Are two citation objects equal when their attributes are
@@ -86,13 +75,8 @@ class ModelsTest(TestCase):
                 source_text="foo", volume="2", reporter="U.S.", page="4"
             ),
         ]
-        print(
-            "Testing citation comparison with different source text...",
-            end=" ",
-        )
         self.assertEqual(citations[0], citations[1])
         self.assertEqual(hash(citations[0]), hash(citations[1]))
-        print("✓")
 
     def test_citation_comparison_with_nominative_reporter(self):
         """Are two citation objects equal when their attributes are
@@ -101,12 +85,8 @@ class ModelsTest(TestCase):
             get_citations("5 U.S. 137")[0],
             get_citations("5 U.S. (1 Cranch) 137")[0],
         ]
-        print(
-            "Testing citation comparison with nominative reporter...", end=" "
-        )
         self.assertEqual(citations[0], citations[1])
         self.assertEqual(hash(citations[0]), hash(citations[1]))
-        print("✓")
 
     def test_citation_comparison_with_different_reporter(self):
         """Are two citation objects different when they have different
@@ -116,12 +96,8 @@ class ModelsTest(TestCase):
             case_citation(2, volume="2", reporter="F. Supp.", page="4"),
             case_citation(2, volume="2", reporter="U. S.", page="4"),
         ]
-        print(
-            "Testing citation comparison with different reporters...", end=" "
-        )
         self.assertNotEqual(citations[0], citations[1])
         self.assertNotEqual(hash(citations[0]), hash(citations[1]))
-        print("✓")
 
     def test_tax_court_citation_comparison(self):
         """Are two citation objects equal when their attributes are
@@ -131,10 +107,8 @@ class ModelsTest(TestCase):
             get_citations("T.C.M. (RIA) ¶ 95,342")[0],
             get_citations("T.C.M. (RIA) ¶ 95,342")[0],
         ]
-        print("Testing tax court citation comparison...", end=" ")
         self.assertEqual(citations[0], citations[1])
         self.assertEqual(hash(citations[0]), hash(citations[1]))
-        print("✓")
 
     def test_id_citation_comparison(self):
         """Are two IdCitation objects always different?"""
@@ -142,10 +116,8 @@ class ModelsTest(TestCase):
             id_citation("Id.,", metadata={"pin_cite": "at 123"}),
             id_citation("Id.,", metadata={"pin_cite": "at 123"}),
         ]
-        print("Testing id citation comparison...", end=" ")
         self.assertNotEqual(citations[0], citations[1])
         self.assertNotEqual(hash(citations[0]), hash(citations[1]))
-        print("✓")
 
     def test_unknown_citation_comparison(self):
         """Are two UnknownCitation objects always different?"""
@@ -153,10 +125,8 @@ class ModelsTest(TestCase):
             unknown_citation("§99"),
             unknown_citation("§99"),
         ]
-        print("Testing unknown citation comparison...", end=" ")
         self.assertNotEqual(citations[0], citations[1])
         self.assertNotEqual(hash(citations[0]), hash(citations[1]))
-        print("✓")
 
     def test_missing_page_cite_conversion(self):
         """Do citations with missing page numbers get their groups['page']
@@ -164,14 +134,11 @@ class ModelsTest(TestCase):
 
         citation1 = case_citation(2, volume="2", reporter="U.S.", page="__")
         citation2 = get_citations("2 U.S. __")[0]
-        print("Testing missing page conversion...", end=" ")
         self.assertIsNone(citation1.groups["page"])
         self.assertIsNone(citation2.groups["page"])
-        print("✓")
 
     def test_persistent_hash(self):
         """Are object hashes reproducible across runs?"""
-        print("Testing persistent citation hash...", end=" ")
         objects = [
             (
                 case_citation(),
@@ -191,17 +158,15 @@ class ModelsTest(TestCase):
             ),
         ]
         for citation, citation_hash in objects:
-            self.assertEqual(hash(citation), citation_hash)
-            print("✓")
+            with self.subTest(type(citation).__name__):
+                self.assertEqual(hash(citation), citation_hash)
 
     def test_hash_function_identity(self):
         """Do hash() and __hash__() output the same hash?"""
         citation = case_citation()
         resource = Resource(case_citation())
-        print("Testing hash function identity...", end=" ")
         self.assertEqual(hash(citation), citation.__hash__())
         self.assertEqual(hash(resource), resource.__hash__())
-        print("✓")
 
     def test_corrected_full_citation_includes_closing_parenthesis(self):
         """Does the corrected_citation_full method return a properly formatted
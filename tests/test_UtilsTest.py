@@ -3,7 +3,7 @@ from textwrap import dedent
 from unittest import TestCase
 
 from eyecite import clean_text, get_citations
-from eyecite.utils import dump_citations
+from eyecite.utils import dump_citations, maybe_balance_style_tags
 
 
 class UtilsTest(TestCase):
@@ -11,6 +11,9 @@ class UtilsTest(TestCase):
         test_pairs = (
             (["inline_whitespace"], "  word \t \n  word  ", " word \n word "),
             (["all_whitespace"], "  word \t \n  word  ", " word word "),
+            (["all_whitespace"], "word\n\nword", "word word"),
+            (["all_whitespace"], " \t\n ", " "),
+            (["all_whitespace"], "", ""),
             (["underscores"], "__word__word_", "wordword_"),
             (["html"], " <style>ignore</style> <i> word </i> ", " word "),
             (
@@ -20,15 +23,12 @@ class UtilsTest(TestCase):
             ),
         )
         for steps, text, expected in test_pairs:
-            print(
-                "Testing clean_text for %s" % text.replace("\n", " "), end=" "
-            )
-            result = clean_text(text, steps)
-            self.assertEqual(
-                result,
-                expected,
-            )
-            print("✓")
+            with self.subTest(text, steps=steps):
+                result = clean_text(text, steps)
+                self.assertEqual(
+                    result,
+                    expected,
+                )
 
     def test_clean_text_invalid(self):
         with self.assertRaises(ValueError):
@@ -56,3 +56,26 @@ class UtilsTest(TestCase):
         """
         )
         self.assertEqual(dumped_text.strip(), expected.strip())
+
+    def test_maybe_balance_style_tags(self):
+        # (plain_text, span_text, expected balanced span text)
+        test_pairs = (
+            # closing tag after the span
+            ("foo <i>Id. at 2</i> bar", "<i>Id. at 2", "<i>Id. at 2</i>"),
+            # opening tag before the span, with whitespace
+            ("foo <em> Id.</em> bar", "Id.</em>", "<em> Id.</em>"),
+            # span text with regex special characters
+            ("<i>Foo (1990</i> bar", "<i>Foo (1990", "<i>Foo (1990</i>"),
+            # too much whitespace before the tag
+            ("foo <i>Id.      </i>", "<i>Id.", "<i>Id."),
+            # no tag at the edge of the span
+            ("<i>Id. bar</i>", "<i>Id.", "<i>Id."),
+        )
+        for plain_text, span_text, expected in test_pairs:
+            with self.subTest(plain_text, span_text=span_text):
+                start = plain_text.index(span_text)
+                end = start + len(span_text)
+                _, _, balanced = maybe_balance_style_tags(
+                    start, end, plain_text
+                )
+                self.assertEqual(balanced, expected)